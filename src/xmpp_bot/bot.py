@@ -6,7 +6,7 @@ import asyncio
 import contextlib
 import logging
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -34,6 +34,7 @@ from .config.constants import (
     LOG_RECONNECTING,
     LOG_SENDING_MESSAGE,
     LOG_SUBSCRIPTION_APPROVED,
+    LOG_UNAUTHORIZED_SENDER,
     MAX_RECONNECT_DELAY,
 )
 from .config.settings import Settings
@@ -55,6 +56,10 @@ logger = logging.getLogger(__name__)
 AsyncMessageHandler = Callable[[str, str, Message], Awaitable[None]]
 AsyncPresenceHandler = Callable[[str, str | None, str | None, Presence], Awaitable[None]]
 
+# Stanza type values, typed as the literals slixmpp expects
+_CHAT: Literal["chat"] = "chat"
+_SUBSCRIBED: Literal["subscribed"] = "subscribed"
+
 
 def _neutralize_stream_finalizer(client: ClientXMPP | None) -> None:
     """Make slixmpp's XMLStream.__del__ a no-op for a client we are discarding.
@@ -81,17 +86,40 @@ def _neutralize_stream_finalizer(client: ClientXMPP | None) -> None:
 class XmppBot:
     """Singleton XMPP bot for sending and receiving messages using slixmpp."""
 
+    __slots__ = (
+        "_init_done",
+        "_settings",
+        "_client",
+        "_initialized",
+        "_connected",
+        "_session_started",
+        "_auth_error",
+        "_ready_event",
+        "_disconnect_requested",
+        "_reconnecting",
+        "_reconnect_task",
+        "_reconnect_delay",
+        "_drain_task",
+        "_drain_deadline",
+        "_handlers",
+        "_async_message_handlers",
+        "_async_presence_handlers",
+        "_async_message_handlers_cache",
+        "_async_presence_handlers_cache",
+        "__weakref__",
+    )
+
     _instance: XmppBot | None = None
-    _lock: asyncio.Lock | None = None
     _init_done: bool
 
     def __new__(cls) -> XmppBot:
         """Ensure only one instance exists."""
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:
             instance = super().__new__(cls)
             instance._init_done = False
             cls._instance = instance
-        return cls._instance
+        return instance
 
     @classmethod
     def get_instance(cls) -> XmppBot:
@@ -100,21 +128,29 @@ class XmppBot:
         Returns:
             The singleton XmppBot instance.
         """
-        return cls()
+        # Skip the __new__/__init__ round trip once the instance exists
+        instance = cls._instance
+        return instance if instance is not None else cls()
 
     @classmethod
     async def reset_instance(cls) -> None:
         """Reset the singleton instance. Used for testing."""
-        if cls._instance is not None:
+        cls._reset_instance_sync()
+
+    @classmethod
+    def _reset_instance_sync(cls) -> None:
+        """Reset the singleton instance without awaiting. Used by test fixtures."""
+        instance = cls._instance
+        if instance is not None:
             with contextlib.suppress(Exception):
-                if cls._instance._reconnect_task is not None:
-                    cls._instance._reconnect_task.cancel()
-                cls._instance.disconnect()
+                if instance._reconnect_task is not None:
+                    instance._reconnect_task.cancel()
+                instance.disconnect()
             cls._instance = None
 
     def __init__(self) -> None:
         """Initialize instance variables (only runs once due to singleton)."""
-        if hasattr(self, "_init_done") and self._init_done:
+        if self._init_done:
             return
         self._init_done = True
 
@@ -124,14 +160,20 @@ class XmppBot:
         self._connected: bool = False
         self._session_started: bool = False
         self._auth_error: str | None = None
+        self._ready_event = asyncio.Event()
         self._disconnect_requested: bool = False
         self._reconnecting: bool = False
         self._reconnect_task: asyncio.Task[None] | None = None
         self._reconnect_delay: float = 0
+        self._drain_task: asyncio.Future[None] | None = None
+        self._drain_deadline: float = 0.0
 
         self._handlers = HandlerRegistry()
         self._async_message_handlers: dict[str, AsyncMessageHandler] = {}
         self._async_presence_handlers: dict[str, AsyncPresenceHandler] = {}
+        # Snapshots rebuilt on add/remove so dispatch never iterates a live dict
+        self._async_message_handlers_cache: tuple[AsyncMessageHandler, ...] = ()
+        self._async_presence_handlers_cache: tuple[AsyncPresenceHandler, ...] = ()
 
     @property
     def settings(self) -> Settings:
@@ -188,82 +230,110 @@ class XmppBot:
         if settings.debug:
             logging.basicConfig(level=logging.DEBUG)
 
+        self._build_client()
         await self._connect()
         self._initialized = True
 
     def _unique_jid(self) -> str:
         """Generate a full JID with a unique resource suffix to avoid conflicts."""
-        assert self._settings is not None
-        resource = f"{self._settings.resource}-{uuid.uuid4().hex[:8]}"
-        return f"{self._settings.jid}/{resource}"
+        settings = self.settings
+        resource = f"{settings.resource}-{uuid.uuid4().hex[:8]}"
+        return f"{settings.jid}/{resource}"
 
-    async def _connect(self) -> None:
-        """Establish connection to the XMPP server."""
-        assert self._settings is not None
+    def _event_handlers(self) -> list[tuple[str, Callable[..., Any]]]:
+        """Get the (event name, handler) pairs the bot registers on its client."""
+        return [
+            ("session_start", self._on_session_start),
+            ("message", self._on_message),
+            ("presence_subscribe", self._on_presence_subscribe),
+            ("presence", self._on_presence),
+            ("failed_auth", self._on_failed_auth),
+            ("disconnected", self._on_disconnected),
+            ("stream_error", self._on_stream_error),
+        ]
 
-        logger.info(LOG_CONNECTING.format(jid=self._settings.jid))
+    def _build_client(self) -> None:
+        """Create the ClientXMPP instance and register event handlers and plugins."""
+        settings = self.settings
 
         self._client = ClientXMPP(
             self._unique_jid(),
-            self._settings.password,
+            settings.password,
         )
 
         # Register event handlers
-        self._client.add_event_handler("session_start", self._on_session_start)
-        self._client.add_event_handler("message", self._on_message)
-        self._client.add_event_handler("presence_subscribe", self._on_presence_subscribe)
-        self._client.add_event_handler("presence", self._on_presence)
-        self._client.add_event_handler("failed_auth", self._on_failed_auth)
-        self._client.add_event_handler("disconnected", self._on_disconnected)
-        self._client.add_event_handler("stream_error", self._on_stream_error)
+        for event_name, handler in self._event_handlers():
+            self._client.add_event_handler(event_name, handler)
 
         # Register plugins
         self._client.register_plugin("xep_0199")  # Ping / keepalive
         self._client.register_plugin("xep_0066")  # Out-of-Band Data
         self._client.register_plugin("xep_0363")  # HTTP File Upload
         self._client["xep_0199"].enable_keepalive(
-            interval=self._settings.keepalive_interval,
-            timeout=self._settings.connect_timeout,
+            interval=settings.keepalive_interval,
+            timeout=settings.connect_timeout,
         )
 
         # Configure whitespace keepalive interval
-        self._client.whitespace_keepalive_interval = self._settings.keepalive_interval
+        self._client.whitespace_keepalive_interval = settings.keepalive_interval
 
-        # Reset state
+    def _reset_session_state(self) -> None:
+        """Clear per-connection state before a new connection attempt."""
         self._session_started = False
         self._auth_error = None
+        # A fresh event per attempt: an Event binds to the loop that first waits
+        # on it, and the bot may be re-initialized under a new loop
+        self._ready_event = asyncio.Event()
+
+    async def _connect(self) -> None:
+        """Establish connection to the XMPP server using the current client."""
+        assert self._client is not None
+        settings = self.settings
+
+        logger.info(LOG_CONNECTING, settings.jid)
+
+        self._reset_session_state()
 
         # Connect (non-blocking)
-        self._client.connect()
+        self._start_connect()
 
         # Wait for session to start or auth to fail
-        timeout = self._settings.connect_timeout
-        start_time = asyncio.get_event_loop().time()
-
-        while not self._session_started and self._auth_error is None:
-            await asyncio.sleep(0.1)
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                self._client.disconnect()
-                _neutralize_stream_finalizer(self._client)
-                raise ConnectionError(f"Connection timed out after {timeout} seconds")
+        timeout = settings.connect_timeout
+        try:
+            await asyncio.wait_for(self._ready_event.wait(), timeout)
+        except TimeoutError:
+            self._client.disconnect()
+            _neutralize_stream_finalizer(self._client)
+            raise ConnectionError(f"Connection timed out after {timeout} seconds") from None
 
         if self._auth_error:
-            raise AuthenticationError(ERR_AUTH_FAILED.format(jid=self._settings.jid))
+            raise AuthenticationError(ERR_AUTH_FAILED.format(jid=settings.jid))
 
         logger.info(LOG_CONNECTED)
         logger.info(LOG_AUTH_SUCCESS)
         self._connected = True
 
+    def _start_connect(self) -> None:
+        """Start connecting the client, skipping DNS SRV lookup if a host is configured."""
+        assert self._client is not None
+        settings = self.settings
+        if settings.host:
+            self._client.connect(settings.host, settings.port)
+        else:
+            self._client.connect()
+
     async def _on_session_start(self, event: dict[str, Any]) -> None:
         """Handle session start event."""
         assert self._client is not None
         self._client.send_presence()
         await self._client.get_roster()  # type: ignore[no-untyped-call]
         self._session_started = True
+        self._ready_event.set()
 
     def _on_failed_auth(self, event: dict[str, Any]) -> None:
         """Handle failed authentication."""
         self._auth_error = "Authentication failed"
+        self._ready_event.set()
 
     def _on_stream_error(self, error: Any) -> None:
         """Handle XMPP stream errors, detecting resource conflicts."""
@@ -280,15 +350,7 @@ class XmppBot:
             return
         # Remove our event handlers BEFORE disconnecting to prevent stale
         # "disconnected" events from spawning duplicate reconnect coroutines.
-        for event_name, handler in [
-            ("session_start", self._on_session_start),
-            ("message", self._on_message),
-            ("presence_subscribe", self._on_presence_subscribe),
-            ("presence", self._on_presence),
-            ("failed_auth", self._on_failed_auth),
-            ("disconnected", self._on_disconnected),
-            ("stream_error", self._on_stream_error),
-        ]:
+        for event_name, handler in self._event_handlers():
             with contextlib.suppress(Exception):
                 target.del_event_handler(event_name, handler)
         old_flag = self._disconnect_requested
@@ -298,6 +360,14 @@ class XmppBot:
         _neutralize_stream_finalizer(target)
         self._disconnect_requested = old_flag
 
+    def _abort_connect_attempt(self) -> None:
+        """Stop an in-flight connection attempt on a client that will be reused."""
+        assert self._client is not None
+        with contextlib.suppress(Exception):
+            self._client.cancel_connection_attempt()
+        with contextlib.suppress(Exception):
+            self._client.abort()
+
     def _on_disconnected(self, event: dict[str, Any]) -> None:
         """Handle disconnection. Triggers auto-reconnect if not intentional."""
         self._connected = False
@@ -328,67 +398,41 @@ class XmppBot:
 
     async def _reconnect_loop(self) -> None:
         """Internal reconnect loop. Retries until success, auth failure, or shutdown."""
-        assert self._settings is not None
+        settings = self.settings
 
         while True:
             if self._disconnect_requested:
                 return
 
             if self._reconnect_delay == 0:
-                self._reconnect_delay = self._settings.retry_delay
+                self._reconnect_delay = settings.retry_delay
             else:
                 self._reconnect_delay = min(self._reconnect_delay * 2, MAX_RECONNECT_DELAY)
 
-            logger.info(f"{LOG_RECONNECTING} in {self._reconnect_delay}s...")
+            logger.info(LOG_RECONNECTING, self._reconnect_delay)
             await asyncio.sleep(self._reconnect_delay)
 
             if self._disconnect_requested:
                 return
 
+            reuse = settings.reuse_client and self._client is not None
             try:
-                self._cleanup_client()
-                self._session_started = False
-                self._auth_error = None
-
-                self._client = ClientXMPP(
-                    self._unique_jid(),
-                    self._settings.password,
-                )
-
-                # Re-register event handlers
-                self._client.add_event_handler("session_start", self._on_session_start)
-                self._client.add_event_handler("message", self._on_message)
-                self._client.add_event_handler("presence_subscribe", self._on_presence_subscribe)
-                self._client.add_event_handler("presence", self._on_presence)
-                self._client.add_event_handler("failed_auth", self._on_failed_auth)
-                self._client.add_event_handler("disconnected", self._on_disconnected)
-                self._client.add_event_handler("stream_error", self._on_stream_error)
-
-                # Re-register plugins
-                self._client.register_plugin("xep_0199")  # Ping / keepalive
-                self._client.register_plugin("xep_0066")  # Out-of-Band Data
-                self._client.register_plugin("xep_0363")  # HTTP File Upload
-                self._client["xep_0199"].enable_keepalive(
-                    interval=self._settings.keepalive_interval,
-                    timeout=self._settings.connect_timeout,
-                )
-                self._client.whitespace_keepalive_interval = self._settings.keepalive_interval
+                if not reuse:
+                    self._cleanup_client()
+                    self._build_client()
+                self._reset_session_state()
 
-                self._client.connect()
+                self._start_connect()
 
                 # Wait for session start
-                timeout = self._settings.connect_timeout
-                start_time = asyncio.get_event_loop().time()
-                timed_out = False
-                while not self._session_started and self._auth_error is None:
-                    await asyncio.sleep(0.1)
-                    if asyncio.get_event_loop().time() - start_time > timeout:
-                        logger.error(LOG_RECONNECT_TIMEOUT)
-                        timed_out = True
-                        break
-
-                if timed_out:
-                    self._cleanup_client()
+                try:
+                    await asyncio.wait_for(self._ready_event.wait(), settings.connect_timeout)
+                except TimeoutError:
+                    logger.error(LOG_RECONNECT_TIMEOUT)
+                    if reuse:
+                        self._abort_connect_attempt()
+                    else:
+                        self._cleanup_client()
                     continue  # retry outer loop
 
                 if self._auth_error:
@@ -400,17 +444,29 @@ class XmppBot:
                 logger.info(LOG_RECONNECT_SUCCESS)
                 return
             except Exception as e:
-                logger.error(LOG_RECONNECT_FAILED.format(error=e))
+                logger.error(LOG_RECONNECT_FAILED, e)
                 continue  # retry via loop
 
     async def _on_message(self, msg: Message) -> None:
         """Handle incoming messages."""
-        logger.debug(
-            "Raw stanza: type=%s from=%s has_body=%s",
-            msg["type"],
-            msg["from"],
-            bool(msg["body"]),
-        )
+        sender_jid: JID = msg["from"]
+        bare_sender = sender_jid.bare
+
+        # Reject unauthorized senders before touching the rest of the stanza
+        if not self.settings.is_bare_jid_allowed(bare_sender):
+            # Only warn about real chat messages; receipts, chat states,
+            # headlines and errors from strangers are dropped quietly
+            if msg["type"] in ("chat", "normal") and msg["body"]:
+                logger.warning(LOG_UNAUTHORIZED_SENDER, bare_sender)
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Raw stanza: type=%s from=%s has_body=%s",
+                msg["type"],
+                sender_jid,
+                bool(msg["body"]),
+            )
         if msg["type"] not in ("chat", "normal"):
             return
 
@@ -418,38 +474,35 @@ class XmppBot:
         if not body:
             return
 
-        sender_jid: JID = msg["from"]
         sender = str(sender_jid)
-        bare_sender = sender_jid.bare
-
-        assert self._settings is not None
-        if not self._settings.is_jid_allowed(bare_sender):
-            logger.warning(f"Message from unauthorized JID: {bare_sender}")
-            return
-
-        logger.debug(LOG_MESSAGE_RECEIVED.format(sender=sender))
+        logger.debug(LOG_MESSAGE_RECEIVED, sender)
 
         # Call sync handlers (legacy support)
         for sync_handler in self._handlers.get_message_handlers():
             try:
                 sync_handler(sender, body, msg)
             except Exception as e:
-                logger.exception(f"Error in message handler: {e}")
+                logger.exception("Error in message handler: %s", e)
 
-        # Call async handlers
-        for async_handler in self._async_message_handlers.values():
+        # Call async handlers concurrently; a handler that fails when called or
+        # returns a non-awaitable is logged and skipped like one that fails later
+        futures: list[asyncio.Future[None]] = []
+        for handler in self._async_message_handlers_cache:
             try:
-                await async_handler(sender, body, msg)
+                futures.append(asyncio.ensure_future(handler(sender, body, msg)))
             except Exception as e:
-                logger.exception(f"Error in async message handler: {e}")
+                logger.exception("Error in async message handler: %s", e)
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error in async message handler: %s", result, exc_info=result)
 
     def _on_presence_subscribe(self, presence: Presence) -> None:
         """Handle subscription requests - auto-approve."""
         assert self._client is not None
         sender = str(presence["from"])
-        ptype: Literal["subscribed"] = "subscribed"
-        self._client.send_presence(pto=sender, ptype=ptype)
-        logger.info(LOG_SUBSCRIPTION_APPROVED.format(jid=sender))
+        self._client.send_presence(pto=sender, ptype=_SUBSCRIBED)
+        logger.info(LOG_SUBSCRIPTION_APPROVED, sender)
 
     async def _on_presence(self, presence: Presence) -> None:
         """Handle incoming presence updates."""
@@ -461,21 +514,28 @@ class XmppBot:
         if self._settings and presence["from"].bare == self._settings.jid:
             pass
         else:
-            logger.debug(LOG_PRESENCE_RECEIVED.format(sender=sender, status=status))
+            logger.debug(LOG_PRESENCE_RECEIVED, sender, status)
 
         # Call sync handlers (legacy support)
         for sync_handler in self._handlers.get_presence_handlers():
             try:
                 sync_handler(sender, presence_type, status, presence)
             except Exception as e:
-                logger.exception(f"Error in presence handler: {e}")
+                logger.exception("Error in presence handler: %s", e)
 
-        # Call async handlers
-        for async_handler in self._async_presence_handlers.values():
+        # Call async handlers concurrently, skipping any that fail when called
+        futures: list[asyncio.Future[None]] = []
+        for handler in self._async_presence_handlers_cache:
             try:
-                await async_handler(sender, presence_type, status, presence)
+                futures.append(
+                    asyncio.ensure_future(handler(sender, presence_type, status, presence))
+                )
             except Exception as e:
-                logger.exception(f"Error in async presence handler: {e}")
+                logger.exception("Error in async presence handler: %s", e)
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error in async presence handler: %s", result, exc_info=result)
 
     def add_message_handler(
         self,
@@ -489,6 +549,7 @@ class XmppBot:
             handler: Async callable that handles messages.
         """
         self._async_message_handlers[name] = handler
+        self._async_message_handlers_cache = tuple(self._async_message_handlers.values())
 
     def remove_message_handler(self, name: str) -> None:
         """Remove a message handler.
@@ -498,6 +559,7 @@ class XmppBot:
         """
         if name in self._async_message_handlers:
             del self._async_message_handlers[name]
+            self._async_message_handlers_cache = tuple(self._async_message_handlers.values())
         else:
             self._handlers.remove_message_handler(name)
 
@@ -513,6 +575,7 @@ class XmppBot:
             handler: Async callable that handles presence updates.
         """
         self._async_presence_handlers[name] = handler
+        self._async_presence_handlers_cache = tuple(self._async_presence_handlers.values())
 
     def remove_presence_handler(self, name: str) -> None:
         """Remove a presence handler.
@@ -522,6 +585,7 @@ class XmppBot:
         """
         if name in self._async_presence_handlers:
             del self._async_presence_handlers[name]
+            self._async_presence_handlers_cache = tuple(self._async_presence_handlers.values())
         else:
             self._handlers.remove_presence_handler(name)
 
@@ -538,8 +602,7 @@ class XmppBot:
         if not self._initialized:
             raise NotInitializedError(ERR_NOT_INITIALIZED)
 
-        assert self._settings is not None
-        await self.reply_to_user(message, self._settings.default_receiver)
+        await self.reply_to_user(message, self.settings.default_receiver)
 
     async def reply_to_user(self, message: str, jid: str) -> None:
         """Send a direct message to a specific JID.
@@ -555,23 +618,51 @@ class XmppBot:
         if not self._initialized:
             raise NotInitializedError(ERR_NOT_INITIALIZED)
 
+        self._send_chat(jid, message)
+
+    def _send_chat(self, jid: str, message: str) -> None:
+        """Queue a chat message to ``jid`` on the client.
+
+        Raises:
+            SendError: If the bot is not connected or sending fails.
+        """
         if not self._connected or not self._client:
             raise SendError(ERR_SEND_FAILED.format(recipient=jid))
 
-        logger.debug(LOG_SENDING_MESSAGE.format(recipient=jid))
+        logger.debug(LOG_SENDING_MESSAGE, jid)
 
         try:
-            mtype: Literal["chat"] = "chat"
             self._client.send_message(
                 mto=jid,  # type: ignore[arg-type]
                 mbody=message,
-                mtype=mtype,
+                mtype=_CHAT,
             )
-            logger.debug(LOG_MESSAGE_SENT.format(recipient=jid))
+            logger.debug(LOG_MESSAGE_SENT, jid)
         except Exception as e:
-            logger.error(f"Send failed: {e}")
+            logger.error("Send failed: %s", e)
             raise SendError(ERR_SEND_FAILED.format(recipient=jid)) from e
 
+    async def send_batch(self, messages: Iterable[tuple[str, str]]) -> None:
+        """Send several direct messages, then wait until they have been written.
+
+        Every stanza is queued before the method yields to the event loop, and a
+        single ``flush`` at the end waits for all of them instead of one per message.
+
+        Args:
+            messages: Iterable of ``(jid, message)`` pairs.
+
+        Raises:
+            NotInitializedError: If the bot is not initialized.
+            SendError: If sending fails.
+        """
+        if not self._initialized:
+            raise NotInitializedError(ERR_NOT_INITIALIZED)
+
+        for jid, message in messages:
+            self._send_chat(jid, message)
+
+        await self.flush()
+
     async def send_audio_file(self, audio_path: str, jid: str) -> None:
         """Send an audio file to a specific JID via HTTP File Upload (XEP-0363).
 
@@ -608,15 +699,17 @@ class XmppBot:
             logger.error("HTTP File Upload failed: %s", exc)
             raise SendError(ERR_SEND_FAILED.format(recipient=jid)) from exc
 
-        mtype: Literal["chat"] = "chat"
-        msg = self._client.make_message(mto=jid, mbody=url, mtype=mtype)
+        msg = self._client.make_message(mto=jid, mbody=url, mtype=_CHAT)
         msg["oob"]["url"] = url
         msg.send()
-        logger.debug(LOG_MESSAGE_SENT.format(recipient=jid))
+        logger.debug(LOG_MESSAGE_SENT, jid)
 
     async def flush(self, timeout: float = 5.0) -> None:
         """Wait for pending outgoing messages to be written to the network.
 
+        Waits for slixmpp's send queue to be processed, then for the transport's
+        write buffer to drain.
+
         Args:
             timeout: Maximum time to wait in seconds.
         """
@@ -627,12 +720,96 @@ class XmppBot:
         if transport is None:
             return
 
-        deadline = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < deadline:
-            buf_size = getattr(transport, "get_write_buffer_size", lambda: 0)()
-            if buf_size == 0:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        # send() only queues stanzas; slixmpp's run_filters task writes them to
+        # the transport later, so wait for that queue before the write buffer.
+        queue = getattr(self._client, "waiting_queue", None)
+        if isinstance(queue, asyncio.Queue):
+            try:
+                await asyncio.wait_for(queue.join(), timeout)
+            except TimeoutError:
+                return
+
+        if hasattr(transport, "get_write_buffer_limits") and hasattr(
+            transport, "set_write_buffer_limits"
+        ):
+            # Concurrent flushes share one drain; each would otherwise patch and
+            # restore resume_writing and the buffer limits over the other's state.
+            # The drain runs until the latest caller's deadline, and each caller
+            # stops waiting at its own.
+            self._drain_deadline = max(self._drain_deadline, deadline)
+            drain = self._drain_task
+            if drain is None or drain.done():
+                drain = asyncio.ensure_future(self._wait_for_drain(transport))
+                self._drain_task = drain
+            try:
+                await asyncio.wait_for(asyncio.shield(drain), max(deadline - loop.time(), 0.0))
+            except TimeoutError:
+                if self._drain_deadline <= deadline:
+                    # Nobody is waiting longer: stop the drain so it restores now
+                    drain.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await drain
+            return
+
+        get_size = getattr(transport, "get_write_buffer_size", None)
+        if get_size is None:
+            return
+
+        # A bare yield lets small writes drain within one loop tick; only fall
+        # back to timed polling if the buffer is still not empty after that.
+        interval = 0.0
+        while loop.time() < deadline:
+            if get_size() == 0:
                 return
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(interval)
+            interval = 0.05
+
+    async def _wait_for_drain(self, transport: Any) -> None:
+        """Wait until the transport's write buffer is empty.
+
+        Temporarily drops the transport's write buffer limits to zero so that it
+        calls ``resume_writing()`` on our protocol (the ClientXMPP instance) the
+        moment the buffer is fully flushed, and resolves a future from there.
+        Gives up at ``_drain_deadline``, which later ``flush`` calls may extend.
+        The original limits and protocol method are restored afterwards. Only
+        one drain runs at a time; see ``flush``.
+        """
+        assert self._client is not None
+        client = self._client
+        loop = asyncio.get_running_loop()
+        drained: asyncio.Future[None] = loop.create_future()
+        original_resume = client.resume_writing
+        # Normally resume_writing is the class method; restoring it by deleting
+        # the patch avoids leaving the client holding a bound method of itself.
+        had_own_resume = "resume_writing" in vars(client)
+
+        def resume_writing() -> None:
+            original_resume()
+            if not drained.done():
+                drained.set_result(None)
+
+        low, high = transport.get_write_buffer_limits()
+        client.resume_writing = resume_writing  # type: ignore[method-assign]
+        try:
+            transport.set_write_buffer_limits(high=0, low=0)
+            if transport.get_write_buffer_size() == 0:
+                return
+            while not drained.done():
+                remaining = self._drain_deadline - loop.time()
+                if remaining <= 0:
+                    return
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(asyncio.shield(drained), remaining)
+        finally:
+            if had_own_resume:
+                client.resume_writing = original_resume  # type: ignore[method-assign]
+            else:
+                del client.resume_writing
+            with contextlib.suppress(Exception):
+                transport.set_write_buffer_limits(high=high, low=low)
 
     async def send_url(self, path: str) -> None:
         """Send a URL constructed from base_url and path.
@@ -646,8 +823,7 @@ class XmppBot:
         if not self._initialized:
             raise NotInitializedError(ERR_NOT_INITIALIZED)
 
-        assert self._settings is not None
-        url = f"{self._settings.base_url.rstrip('/')}/{path.lstrip('/')}"
+        url = f"{self.settings.base_url_stripped}/{path.lstrip('/')}"
         await self.send_message(url)
 
     def run_forever(self) -> None:
@@ -685,9 +861,12 @@ class XmppBot:
         self._session_started = False
         self._reconnecting = False
         self._client = None
+        self._drain_task = None
         self._handlers.clear()
         self._async_message_handlers.clear()
         self._async_presence_handlers.clear()
+        self._async_message_handlers_cache = ()
+        self._async_presence_handlers_cache = ()
 
         logger.info(LOG_DISCONNECTED)
 
@@ -700,13 +879,11 @@ class XmppBot:
         if not self._initialized:
             raise NotInitializedError(ERR_NOT_INITIALIZED)
 
-        assert self._settings is not None
         if self._client:
-            mtype: Literal["chat"] = "chat"
             self._client.send_message(
-                mto=self._settings.default_receiver,  # type: ignore[arg-type]
+                mto=self.settings.default_receiver,  # type: ignore[arg-type]
                 mbody=message,
-                mtype=mtype,
+                mtype=_CHAT,
             )
 
     def shutdown(self) -> None:
@@ -4,8 +4,10 @@ from .constants import (
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_DEBUG,
     DEFAULT_KEEPALIVE_INTERVAL,
+    DEFAULT_PORT,
     DEFAULT_RESOURCE,
     DEFAULT_RETRY_DELAY,
+    DEFAULT_REUSE_CLIENT,
     DEFAULT_SEND_DELAY,
     MESSAGE_CHAT,
     MESSAGE_GROUPCHAT,
@@ -23,8 +25,10 @@ __all__ = [
     "DEFAULT_CONNECT_TIMEOUT",
     "DEFAULT_DEBUG",
     "DEFAULT_KEEPALIVE_INTERVAL",
+    "DEFAULT_PORT",
     "DEFAULT_RESOURCE",
     "DEFAULT_RETRY_DELAY",
+    "DEFAULT_REUSE_CLIENT",
     "DEFAULT_SEND_DELAY",
     "MESSAGE_CHAT",
     "MESSAGE_GROUPCHAT",
@@ -11,6 +11,9 @@ ENV_KEEPALIVE_INTERVAL = "XMPP_KEEPALIVE_INTERVAL"
 ENV_RETRY_DELAY = "XMPP_RETRY_DELAY"
 ENV_SEND_DELAY = "XMPP_SEND_DELAY"
 ENV_RESOURCE = "XMPP_RESOURCE"
+ENV_HOST = "XMPP_HOST"
+ENV_PORT = "XMPP_PORT"
+ENV_REUSE_CLIENT = "XMPP_REUSE_CLIENT"
 ENV_DEBUG = "XMPP_DEBUG"
 
 # Default values
@@ -19,6 +22,8 @@ DEFAULT_KEEPALIVE_INTERVAL = 60
 DEFAULT_RETRY_DELAY = 5.0
 DEFAULT_SEND_DELAY = 0.1
 DEFAULT_RESOURCE = "xmpp-bot"
+DEFAULT_PORT = 5222
+DEFAULT_REUSE_CLIENT = False
 DEFAULT_DEBUG = False
 MAX_RECONNECT_DELAY = 300
 
@@ -36,25 +41,26 @@ ERR_SEND_FAILED = "Failed to send message to {recipient}"
 ERR_HANDLER_EXISTS = "Handler '{name}' already registered"
 ERR_HANDLER_NOT_FOUND = "Handler '{name}' not found"
 
-# Log messages
-LOG_CONNECTING = "Connecting to XMPP server as {jid}..."
+# Log messages (%-style, formatted lazily by logging)
+LOG_CONNECTING = "Connecting to XMPP server as %s..."
 LOG_CONNECTED = "Connected to XMPP server"
 LOG_AUTH_SUCCESS = "Authentication successful"
 LOG_DISCONNECTING = "Disconnecting from XMPP server..."
 LOG_DISCONNECTED = "Disconnected from XMPP server"
-LOG_SENDING_MESSAGE = "Sending message to {recipient}"
-LOG_MESSAGE_SENT = "Message sent to {recipient}"
-LOG_MESSAGE_RECEIVED = "Message received from {sender}"
-LOG_PRESENCE_RECEIVED = "Presence received from {sender}: {status}"
-LOG_HANDLER_REGISTERED = "Handler '{name}' registered"
-LOG_HANDLER_REMOVED = "Handler '{name}' removed"
+LOG_SENDING_MESSAGE = "Sending message to %s"
+LOG_MESSAGE_SENT = "Message sent to %s"
+LOG_MESSAGE_RECEIVED = "Message received from %s"
+LOG_PRESENCE_RECEIVED = "Presence received from %s: %s"
+LOG_HANDLER_REGISTERED = "Handler '%s' registered"
+LOG_HANDLER_REMOVED = "Handler '%s' removed"
 LOG_KEEPALIVE_SENT = "Keepalive presence sent"
-LOG_RECONNECTING = "Reconnecting to XMPP server..."
+LOG_RECONNECTING = "Reconnecting to XMPP server in %ss..."
 LOG_RECONNECT_SUCCESS = "Reconnected to XMPP server successfully"
-LOG_RECONNECT_FAILED = "Reconnection failed: {error}"
+LOG_RECONNECT_FAILED = "Reconnection failed: %s"
 LOG_RECONNECT_TIMEOUT = "Reconnection timed out"
 LOG_RECONNECT_AUTH_FAILED = "Reconnection auth failed, stopping reconnection attempts"
-LOG_SUBSCRIPTION_APPROVED = "Subscription request approved for {jid}"
+LOG_SUBSCRIPTION_APPROVED = "Subscription request approved for %s"
+LOG_UNAUTHORIZED_SENDER = "Message from unauthorized JID: %s"
 LOG_CONFLICT_DETECTED = (
     "Resource conflict detected — another client is using the same JID. "
     "Ensure no other instance of this bot is running."
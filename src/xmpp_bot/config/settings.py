@@ -3,29 +3,34 @@
 from __future__ import annotations
 
 import os
-import re
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 from .constants import (
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_DEBUG,
     DEFAULT_KEEPALIVE_INTERVAL,
+    DEFAULT_PORT,
     DEFAULT_RESOURCE,
     DEFAULT_RETRY_DELAY,
+    DEFAULT_REUSE_CLIENT,
     DEFAULT_SEND_DELAY,
     ENV_ALLOWED_JIDS,
     ENV_BASE_URL,
     ENV_CONNECT_TIMEOUT,
     ENV_DEBUG,
     ENV_DEFAULT_RECEIVER,
+    ENV_HOST,
     ENV_JID,
     ENV_KEEPALIVE_INTERVAL,
     ENV_PASSWORD,
+    ENV_PORT,
     ENV_RESOURCE,
     ENV_RETRY_DELAY,
+    ENV_REUSE_CLIENT,
     ENV_SEND_DELAY,
     ERR_DEFAULT_RECEIVER_REQUIRED,
     ERR_INVALID_JID,
@@ -33,13 +38,24 @@ from .constants import (
     ERR_PASSWORD_REQUIRED,
 )
 
-# JID validation pattern (basic validation)
-JID_PATTERN = re.compile(r"^[^@]+@[^@/]+(?:/[^@]+)?$")
+# Numeric settings read by from_env: (field name, env var, default, parser).
+# Defaults are used as-is, so they never round-trip through str().
+_ENV_SPEC: tuple[tuple[str, str, float, Callable[[str], float]], ...] = (
+    ("connect_timeout", ENV_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT, int),
+    ("keepalive_interval", ENV_KEEPALIVE_INTERVAL, DEFAULT_KEEPALIVE_INTERVAL, int),
+    ("retry_delay", ENV_RETRY_DELAY, DEFAULT_RETRY_DELAY, float),
+    ("send_delay", ENV_SEND_DELAY, DEFAULT_SEND_DELAY, float),
+    ("port", ENV_PORT, DEFAULT_PORT, int),
+)
 
 
 def _validate_jid(jid: str, field_name: str = "JID") -> None:
-    """Validate a JID format."""
-    if not JID_PATTERN.match(jid):
+    """Validate a JID format (basic ``user@domain[/resource]`` check)."""
+    user, at, rest = jid.partition("@")
+    if not at or not user or "@" in rest:
+        raise ValueError(ERR_INVALID_JID.format(jid=jid))
+    domain, slash, resource = rest.partition("/")
+    if not domain or (slash and not resource):
         raise ValueError(ERR_INVALID_JID.format(jid=jid))
 
 
@@ -59,7 +75,8 @@ def _parse_allowed_jids(value: str | None) -> frozenset[str] | None:
         return None
     for jid in jids:
         _validate_jid(jid, "allowed JID")
-    return frozenset(jids)
+    # Interned so membership checks can hit the identity fast path
+    return frozenset(sys.intern(jid) for jid in jids)
 
 
 @dataclass(frozen=True)
@@ -77,6 +94,9 @@ class Settings:
     send_delay: float = DEFAULT_SEND_DELAY
     resource: str = DEFAULT_RESOURCE
     debug: bool = DEFAULT_DEBUG
+    host: str | None = None
+    port: int = DEFAULT_PORT
+    reuse_client: bool = DEFAULT_REUSE_CLIENT
 
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
@@ -90,32 +110,42 @@ class Settings:
         _validate_jid(self.jid, "JID")
         _validate_jid(self.default_receiver, "default receiver")
 
-    @property
+    # cached_property stores into the instance __dict__ directly, so it works on a
+    # frozen dataclass and, unlike fields, stays out of asdict() and __init__
+    @cached_property
     def jid_user(self) -> str:
         """Extract the user part of the JID (before @)."""
-        return self.jid.split("@")[0]
+        return self.jid.partition("@")[0]
 
-    @property
+    @cached_property
     def jid_domain(self) -> str:
         """Extract the domain part of the JID (after @, before /)."""
-        domain_part = self.jid.split("@")[1]
-        return domain_part.split("/")[0]
+        return self.jid.partition("@")[2].partition("/")[0]
 
-    @property
+    @cached_property
     def full_jid(self) -> str:
         """Get the full JID with resource."""
         if "/" in self.jid:
             return self.jid
         return f"{self.jid}/{self.resource}"
 
+    @cached_property
+    def base_url_stripped(self) -> str:
+        """Get the base URL without trailing slashes."""
+        return self.base_url.rstrip("/")
+
     def is_jid_allowed(self, jid: str) -> bool:
         """Check if a JID is allowed to interact with the bot."""
         if self.allowed_jids is None:
             return True
         # Extract bare JID (without resource) for comparison
-        bare_jid = jid.split("/")[0]
+        bare_jid = jid.partition("/")[0]
         return bare_jid in self.allowed_jids
 
+    def is_bare_jid_allowed(self, bare_jid: str) -> bool:
+        """Check if an already-bare JID (no resource) is allowed to interact with the bot."""
+        return self.allowed_jids is None or bare_jid in self.allowed_jids
+
     @classmethod
     def from_env(cls, env_path: str | Path | None = None) -> Settings:
         """Create Settings from environment variables.
@@ -130,6 +160,9 @@ class Settings:
         Raises:
             ValueError: If required environment variables are missing or invalid.
         """
+        # Imported lazily so constructing Settings directly doesn't load dotenv
+        from dotenv import load_dotenv
+
         if env_path:
             load_dotenv(env_path)
         else:
@@ -141,12 +174,15 @@ class Settings:
         base_url = os.getenv(ENV_BASE_URL, "")
         allowed_jids = _parse_allowed_jids(os.getenv(ENV_ALLOWED_JIDS))
 
-        connect_timeout = int(os.getenv(ENV_CONNECT_TIMEOUT, str(DEFAULT_CONNECT_TIMEOUT)))
-        keepalive_interval = int(os.getenv(ENV_KEEPALIVE_INTERVAL, str(DEFAULT_KEEPALIVE_INTERVAL)))
-        retry_delay = float(os.getenv(ENV_RETRY_DELAY, str(DEFAULT_RETRY_DELAY)))
-        send_delay = float(os.getenv(ENV_SEND_DELAY, str(DEFAULT_SEND_DELAY)))
+        env = os.environ
+        numeric = {
+            name: parser(env[key]) if key in env else default
+            for name, key, default, parser in _ENV_SPEC
+        }
         resource = os.getenv(ENV_RESOURCE, DEFAULT_RESOURCE)
         debug = _parse_bool(os.getenv(ENV_DEBUG), DEFAULT_DEBUG)
+        host = os.getenv(ENV_HOST) or None
+        reuse_client = _parse_bool(os.getenv(ENV_REUSE_CLIENT), DEFAULT_REUSE_CLIENT)
 
         return cls(
             jid=jid,
@@ -154,12 +190,11 @@ class Settings:
             default_receiver=default_receiver,
             base_url=base_url,
             allowed_jids=allowed_jids,
-            connect_timeout=connect_timeout,
-            keepalive_interval=keepalive_interval,
-            retry_delay=retry_delay,
-            send_delay=send_delay,
             resource=resource,
             debug=debug,
+            host=host,
+            reuse_client=reuse_client,
+            **numeric,  # type: ignore[arg-type]
         )
 
     @classmethod
@@ -182,6 +217,8 @@ class Settings:
         keepalive_raw = data.get("keepalive_interval")
         retry_raw = data.get("retry_delay")
         send_raw = data.get("send_delay")
+        host_raw = data.get("host")
+        port_raw = data.get("port")
 
         connect_timeout_val = (
             int(str(connect_timeout_raw))
@@ -193,6 +230,7 @@ class Settings:
         )
         retry_val = float(str(retry_raw)) if retry_raw is not None else DEFAULT_RETRY_DELAY
         send_val = float(str(send_raw)) if send_raw is not None else DEFAULT_SEND_DELAY
+        port_val = int(str(port_raw)) if port_raw is not None else DEFAULT_PORT
 
         return cls(
             jid=str(data.get("jid", "")),
@@ -206,4 +244,7 @@ class Settings:
             send_delay=send_val,
             resource=str(data.get("resource", DEFAULT_RESOURCE)),
             debug=bool(data.get("debug", DEFAULT_DEBUG)),
+            host=str(host_raw) if host_raw else None,
+            port=port_val,
+            reuse_client=bool(data.get("reuse_client", DEFAULT_REUSE_CLIENT)),
         )
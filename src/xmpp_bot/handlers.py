@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Protocol, TypeVar
 
 from .config.constants import (
     ERR_HANDLER_EXISTS,
@@ -18,8 +19,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+_HandlerT = TypeVar("_HandlerT")
+
 
-@runtime_checkable
 class MessageHandler(Protocol):
     """Protocol for message handlers."""
 
@@ -34,7 +38,6 @@ class MessageHandler(Protocol):
         ...
 
 
-@runtime_checkable
 class PresenceHandler(Protocol):
     """Protocol for presence handlers."""
 
@@ -52,13 +55,38 @@ class PresenceHandler(Protocol):
         ...
 
 
+def _add(store: dict[str, _HandlerT], name: str, handler: _HandlerT) -> None:
+    """Register a handler in a store, shared by the message and presence methods."""
+    count = len(store)
+    store.setdefault(name, handler)
+    if len(store) == count:
+        raise HandlerExistsError(ERR_HANDLER_EXISTS.format(name=name))
+    logger.debug(LOG_HANDLER_REGISTERED, name)
+
+
+def _remove(store: dict[str, _HandlerT], name: str) -> None:
+    """Remove a handler from a store, shared by the message and presence methods."""
+    if store.pop(name, _MISSING) is _MISSING:
+        raise HandlerNotFoundError(ERR_HANDLER_NOT_FOUND.format(name=name))
+    logger.debug(LOG_HANDLER_REMOVED, name)
+
+
 class HandlerRegistry:
     """Registry for message and presence handlers."""
 
+    __slots__ = (
+        "_message_handlers",
+        "_presence_handlers",
+        "_message_handlers_cache",
+        "_presence_handlers_cache",
+    )
+
     def __init__(self) -> None:
         """Initialize the handler registry."""
         self._message_handlers: dict[str, MessageHandler] = {}
         self._presence_handlers: dict[str, PresenceHandler] = {}
+        self._message_handlers_cache: tuple[MessageHandler, ...] | None = None
+        self._presence_handlers_cache: tuple[PresenceHandler, ...] | None = None
 
     def add_message_handler(self, name: str, handler: MessageHandler) -> None:
         """Register a message handler.
@@ -70,10 +98,8 @@ class HandlerRegistry:
         Raises:
             HandlerExistsError: If a handler with this name already exists.
         """
-        if name in self._message_handlers:
-            raise HandlerExistsError(ERR_HANDLER_EXISTS.format(name=name))
-        self._message_handlers[name] = handler
-        logger.debug(LOG_HANDLER_REGISTERED.format(name=name))
+        _add(self._message_handlers, name, handler)
+        self._message_handlers_cache = None
 
     def remove_message_handler(self, name: str) -> None:
         """Remove a message handler.
@@ -84,10 +110,8 @@ class HandlerRegistry:
         Raises:
             HandlerNotFoundError: If no handler with this name exists.
         """
-        if name not in self._message_handlers:
-            raise HandlerNotFoundError(ERR_HANDLER_NOT_FOUND.format(name=name))
-        del self._message_handlers[name]
-        logger.debug(LOG_HANDLER_REMOVED.format(name=name))
+        _remove(self._message_handlers, name)
+        self._message_handlers_cache = None
 
     def add_presence_handler(self, name: str, handler: PresenceHandler) -> None:
         """Register a presence handler.
@@ -99,10 +123,8 @@ class HandlerRegistry:
         Raises:
             HandlerExistsError: If a handler with this name already exists.
         """
-        if name in self._presence_handlers:
-            raise HandlerExistsError(ERR_HANDLER_EXISTS.format(name=name))
-        self._presence_handlers[name] = handler
-        logger.debug(LOG_HANDLER_REGISTERED.format(name=name))
+        _add(self._presence_handlers, name, handler)
+        self._presence_handlers_cache = None
 
     def remove_presence_handler(self, name: str) -> None:
         """Remove a presence handler.
@@ -113,26 +135,34 @@ class HandlerRegistry:
         Raises:
             HandlerNotFoundError: If no handler with this name exists.
         """
-        if name not in self._presence_handlers:
-            raise HandlerNotFoundError(ERR_HANDLER_NOT_FOUND.format(name=name))
-        del self._presence_handlers[name]
-        logger.debug(LOG_HANDLER_REMOVED.format(name=name))
+        _remove(self._presence_handlers, name)
+        self._presence_handlers_cache = None
 
-    def get_message_handlers(self) -> list[MessageHandler]:
+    def get_message_handlers(self) -> Sequence[MessageHandler]:
         """Get all registered message handlers.
 
+        The snapshot is cached until the next add, remove or clear.
+
         Returns:
-            List of message handler callables.
+            Immutable sequence of message handler callables.
         """
-        return list(self._message_handlers.values())
+        cache = self._message_handlers_cache
+        if cache is None:
+            cache = self._message_handlers_cache = tuple(self._message_handlers.values())
+        return cache
 
-    def get_presence_handlers(self) -> list[PresenceHandler]:
+    def get_presence_handlers(self) -> Sequence[PresenceHandler]:
         """Get all registered presence handlers.
 
+        The snapshot is cached until the next add, remove or clear.
+
         Returns:
-            List of presence handler callables.
+            Immutable sequence of presence handler callables.
         """
-        return list(self._presence_handlers.values())
+        cache = self._presence_handlers_cache
+        if cache is None:
+            cache = self._presence_handlers_cache = tuple(self._presence_handlers.values())
+        return cache
 
     def has_message_handler(self, name: str) -> bool:
         """Check if a message handler is registered.
@@ -160,3 +190,5 @@ class HandlerRegistry:
         """Remove all handlers."""
         self._message_handlers.clear()
         self._presence_handlers.clear()
+        self._message_handlers_cache = None
+        self._presence_handlers_cache = None
@@ -10,8 +10,10 @@ import pytest
 
 from xmpp_bot import Settings, XmppBot
 
+_ALLOWED_JIDS = frozenset(("user@example.com", "admin@example.com"))
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def valid_settings() -> Settings:
     """Create valid settings for testing."""
     return Settings(
@@ -19,7 +21,7 @@ def valid_settings() -> Settings:
         password="secret123",
         default_receiver="user@example.com",
         base_url="https://example.com",
-        allowed_jids=frozenset(["user@example.com", "admin@example.com"]),
+        allowed_jids=_ALLOWED_JIDS,
         connect_timeout=30,
         keepalive_interval=60,
         retry_delay=5.0,
@@ -29,7 +31,7 @@ def valid_settings() -> Settings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_settings() -> Settings:
     """Create minimal valid settings."""
     return Settings(
@@ -39,52 +41,68 @@ def minimal_settings() -> Settings:
     )
 
 
+# Shared client mock, reset per test instead of rebuilding the mock tree
+_MOCK_CLIENT = MagicMock()
+_MOCK_CLIENT.get_roster = AsyncMock()
+_EVENT_HANDLERS: dict[str, list[Any]] = {}
+
+
+def _add_event_handler(event: str, handler: Any) -> None:
+    """Record a handler registered on the mock client for later triggering."""
+    _EVENT_HANDLERS.setdefault(event, []).append(handler)
+
+
+def _reset_mock_client() -> MagicMock:
+    """Reset the shared client mock to its configured state."""
+    mock_client = _MOCK_CLIENT
+    mock_client.reset_mock(side_effect=True)
+    # Plain values a previous test may have assigned; flush() treats None as absent
+    mock_client.transport = None
+    mock_client.waiting_queue = None
+    # Set as an instance attribute, like a test double would, so flush() restores
+    # it after draining instead of deleting it
+    mock_client.resume_writing = MagicMock()
+    mock_client.connect.return_value = None
+    mock_client.disconnect.return_value = None
+    mock_client.send_presence.return_value = None
+    mock_client.send_message.return_value = None
+    mock_client.get_roster.return_value = None
+    mock_client.process.return_value = None
+    mock_client.add_event_handler.side_effect = _add_event_handler
+    _EVENT_HANDLERS.clear()
+    return mock_client
+
+
+@pytest.fixture(scope="session")
+def _patched_client_class(request: pytest.FixtureRequest) -> MagicMock:
+    """Patch slixmpp.ClientXMPP once for the whole session."""
+    patcher = patch("xmpp_bot.bot.ClientXMPP")
+    mock_client_class: MagicMock = patcher.start()
+    request.addfinalizer(patcher.stop)
+    return mock_client_class
+
+
 @pytest.fixture
-def mock_slixmpp_client() -> Generator[MagicMock, None, None]:
+def mock_slixmpp_client(_patched_client_class: MagicMock) -> MagicMock:
     """Mock the slixmpp.ClientXMPP class."""
-    with patch("xmpp_bot.bot.ClientXMPP") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client.connect.return_value = None
-        mock_client.disconnect.return_value = None
-        mock_client.send_presence.return_value = None
-        mock_client.send_message.return_value = None
-        mock_client.get_roster = AsyncMock(return_value=None)
-        mock_client.process.return_value = None
-        mock_client.add_event_handler = MagicMock()
-        mock_client.del_event_handler = MagicMock()
-        mock_client_class.return_value = mock_client
-        yield mock_client
+    _patched_client_class.reset_mock()
+    mock_client = _reset_mock_client()
+    _patched_client_class.return_value = mock_client
+    return mock_client
 
 
 @pytest.fixture
-def mock_slixmpp_modules() -> Generator[dict[str, Any], None, None]:
+def mock_slixmpp_modules(_patched_client_class: MagicMock) -> dict[str, Any]:
     """Mock slixmpp module components."""
-    with patch("xmpp_bot.bot.ClientXMPP") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client.connect.return_value = None
-        mock_client.disconnect.return_value = None
-        mock_client.send_presence.return_value = None
-        mock_client.send_message.return_value = None
-        mock_client.get_roster = AsyncMock(return_value=None)
-        mock_client.process.return_value = None
-
-        # Store event handlers for triggering
-        event_handlers: dict[str, list[Any]] = {}
-
-        def add_event_handler(event: str, handler: Any) -> None:
-            if event not in event_handlers:
-                event_handlers[event] = []
-            event_handlers[event].append(handler)
-
-        mock_client.add_event_handler = MagicMock(side_effect=add_event_handler)
-        mock_client.del_event_handler = MagicMock()
-        mock_client_class.return_value = mock_client
-
-        yield {
-            "client_class": mock_client_class,
-            "client": mock_client,
-            "event_handlers": event_handlers,
-        }
+    _patched_client_class.reset_mock()
+    mock_client = _reset_mock_client()
+    _patched_client_class.return_value = mock_client
+
+    return {
+        "client_class": _patched_client_class,
+        "client": mock_client,
+        "event_handlers": _EVENT_HANDLERS,
+    }
 
 
 @pytest.fixture
@@ -92,42 +110,22 @@ async def bot_instance(
     mock_slixmpp_modules: dict[str, Any], valid_settings: Settings
 ) -> AsyncGenerator[XmppBot, None]:
     """Create a bot instance with mocked slixmpp."""
-    await XmppBot.reset_instance()
     bot = XmppBot.get_instance()
 
-    # Trigger session_start after connect is called
-    async def simulate_connection() -> None:
-        # Find session_start handler and call it
-        handlers = mock_slixmpp_modules["event_handlers"]
-        if "session_start" in handlers:
-            for handler in handlers["session_start"]:
-                if callable(handler):
-                    result = handler({})
-                    if hasattr(result, "__await__"):
-                        await result
-
-    # Patch the _connect method to also trigger session_start
-    original_connect = bot._connect
-
-    async def patched_connect() -> None:
-        await original_connect()
-
-    with patch.object(bot, "_connect", patched_connect):
-        # Directly set internal state for testing
-        bot._settings = valid_settings
-        bot._client = mock_slixmpp_modules["client"]
-        bot._initialized = True
-        bot._connected = True
-        bot._session_started = True
+    # Directly set internal state for testing
+    bot._settings = valid_settings
+    bot._client = mock_slixmpp_modules["client"]
+    bot._initialized = True
+    bot._connected = True
+    bot._session_started = True
 
     yield bot
     bot.disconnect()
-    await XmppBot.reset_instance()
 
 
 @pytest.fixture(autouse=True)
-async def reset_bot_singleton() -> AsyncGenerator[None, None]:
+def reset_bot_singleton() -> Generator[None, None, None]:
     """Reset the bot singleton before and after each test."""
-    await XmppBot.reset_instance()
+    XmppBot._reset_instance_sync()
     yield
-    await XmppBot.reset_instance()
+    XmppBot._reset_instance_sync()
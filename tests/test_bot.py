@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import weakref
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -23,6 +26,11 @@ class TestSingleton:
         bot2 = XmppBot.get_instance()
         assert bot1 is bot2
 
+    async def test_instance_supports_weak_references(self) -> None:
+        """Test that the slotted singleton can still be weakly referenced."""
+        bot = XmppBot.get_instance()
+        assert weakref.ref(bot)() is bot
+
     async def test_reset_instance(
         self, mock_slixmpp_modules: dict[str, Any], valid_settings: Settings
     ) -> None:
@@ -52,6 +60,28 @@ class TestInitialization:
         with pytest.raises(AlreadyInitializedError):
             await bot_instance.initialize(settings=valid_settings)
 
+    def test_initialize_across_event_loops(
+        self, mock_slixmpp_modules: dict[str, Any], valid_settings: Settings
+    ) -> None:
+        """Test that the bot can be initialized again under a new event loop."""
+        bot = XmppBot.get_instance()
+
+        def start_session_soon(*args: Any, **kwargs: Any) -> None:
+            # Fire session_start after _connect has started waiting
+            event = bot._ready_event
+            asyncio.get_running_loop().call_later(0.01, event.set)
+
+        mock_slixmpp_modules["client"].connect.side_effect = start_session_soon
+
+        async def run_once() -> None:
+            await bot.initialize(settings=valid_settings)
+            bot.disconnect()
+
+        asyncio.run(run_once())
+        asyncio.run(run_once())
+
+        assert mock_slixmpp_modules["client"].connect.call_count == 2
+
 
 class TestMessaging:
     """Test message sending."""
@@ -83,6 +113,28 @@ class TestMessaging:
         await bot_instance.send_url("/path/to/resource")
         mock_slixmpp_modules["client"].send_message.assert_called()
 
+    async def test_send_batch(
+        self, bot_instance: XmppBot, mock_slixmpp_modules: dict[str, Any]
+    ) -> None:
+        """Test that a batch sends one stanza per pair and flushes once."""
+        with patch.object(XmppBot, "flush", new_callable=AsyncMock) as mock_flush:
+            await bot_instance.send_batch(
+                [("one@example.com", "first"), ("two@example.com", "second")]
+            )
+
+        send = mock_slixmpp_modules["client"].send_message
+        assert [call.kwargs["mto"] for call in send.call_args_list] == [
+            "one@example.com",
+            "two@example.com",
+        ]
+        mock_flush.assert_awaited_once()
+
+    async def test_send_batch_not_initialized(self) -> None:
+        """Test that batching without initialization raises error."""
+        bot = XmppBot.get_instance()
+        with pytest.raises(NotInitializedError):
+            await bot.send_batch([("one@example.com", "first")])
+
     def test_send_message_sync_legacy(
         self, bot_instance: XmppBot, mock_slixmpp_modules: dict[str, Any]
     ) -> None:
@@ -91,6 +143,165 @@ class TestMessaging:
         mock_slixmpp_modules["client"].send_message.assert_called()
 
 
+class _FakeTransport:
+    """Write transport stand-in that notifies its protocol when drained."""
+
+    def __init__(self, protocol: Any, buffered: int) -> None:
+        self.protocol = protocol
+        self.buffered = buffered
+        self.low, self.high = 16384, 65536
+
+    def get_write_buffer_size(self) -> int:
+        return self.buffered
+
+    def get_write_buffer_limits(self) -> tuple[int, int]:
+        return self.low, self.high
+
+    def set_write_buffer_limits(self, high: int | None = None, low: int | None = None) -> None:
+        assert high is not None and low is not None
+        self.high, self.low = high, low
+
+    def drain(self) -> None:
+        self.buffered = 0
+        self.protocol.resume_writing()
+
+
+class _FakeProtocol:
+    """Protocol stand-in whose resume_writing lives on the class, as on ClientXMPP."""
+
+    def __init__(self) -> None:
+        self.transport: _FakeTransport | None = None
+        self.resumed = 0
+
+    def resume_writing(self) -> None:
+        self.resumed += 1
+
+
+class TestFlush:
+    """Test waiting for the outgoing buffer to drain."""
+
+    async def test_flush_wakes_when_buffer_drains(self, bot_instance: XmppBot) -> None:
+        """Test that flush returns once the transport reports an empty buffer."""
+        transport = _FakeTransport(bot_instance._client, buffered=128)
+        bot_instance._client.transport = transport  # type: ignore[union-attr]
+
+        asyncio.get_running_loop().call_soon(transport.drain)
+        await asyncio.wait_for(bot_instance.flush(timeout=5.0), 1.0)
+
+        assert transport.buffered == 0
+        assert transport.get_write_buffer_limits() == (16384, 65536)
+
+    async def test_flush_gives_up_after_timeout(self, bot_instance: XmppBot) -> None:
+        """Test that flush returns after the timeout and restores buffer limits."""
+        transport = _FakeTransport(bot_instance._client, buffered=128)
+        bot_instance._client.transport = transport  # type: ignore[union-attr]
+
+        await bot_instance.flush(timeout=0.01)
+
+        assert transport.buffered == 128
+        assert transport.get_write_buffer_limits() == (16384, 65536)
+
+    async def test_concurrent_flushes_share_one_drain(self, bot_instance: XmppBot) -> None:
+        """Test that overlapping flushes do not clobber each other's patches."""
+        client = bot_instance._client
+        original_resume = client.resume_writing  # type: ignore[union-attr]
+        transport = _FakeTransport(client, buffered=128)
+        client.transport = transport  # type: ignore[union-attr]
+
+        asyncio.get_running_loop().call_later(0.01, transport.drain)
+        await asyncio.wait_for(
+            asyncio.gather(bot_instance.flush(timeout=5.0), bot_instance.flush(timeout=5.0)),
+            1.0,
+        )
+
+        assert transport.get_write_buffer_limits() == (16384, 65536)
+        assert client.resume_writing is original_resume  # type: ignore[union-attr]
+
+    async def test_flush_removes_resume_writing_patch(self, bot_instance: XmppBot) -> None:
+        """Test that the patch is deleted so the client keeps its class method."""
+        client = _FakeProtocol()
+        transport = _FakeTransport(client, buffered=128)
+        client.transport = transport
+        bot_instance._client = client  # type: ignore[assignment]
+
+        asyncio.get_running_loop().call_soon(transport.drain)
+        await asyncio.wait_for(bot_instance.flush(timeout=5.0), 1.0)
+
+        assert "resume_writing" not in vars(client)
+        assert client.resumed == 1
+
+    async def test_joining_flush_uses_its_own_timeout(self, bot_instance: XmppBot) -> None:
+        """Test that a short flush joining a long drain returns at its own deadline."""
+        transport = _FakeTransport(bot_instance._client, buffered=128)
+        bot_instance._client.transport = transport  # type: ignore[union-attr]
+
+        long_flush = asyncio.create_task(bot_instance.flush(timeout=2.0))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(bot_instance.flush(timeout=0.05), 0.5)
+
+        assert not long_flush.done()
+        transport.drain()
+        await asyncio.wait_for(long_flush, 0.5)
+
+    async def test_joining_flush_extends_the_drain(self, bot_instance: XmppBot) -> None:
+        """Test that a long flush joining a short drain waits for the buffer to empty."""
+        transport = _FakeTransport(bot_instance._client, buffered=128)
+        bot_instance._client.transport = transport  # type: ignore[union-attr]
+
+        short_flush = asyncio.create_task(bot_instance.flush(timeout=0.05))
+        await asyncio.sleep(0)
+        asyncio.get_running_loop().call_later(0.2, transport.drain)
+        await asyncio.wait_for(bot_instance.flush(timeout=2.0), 1.0)
+
+        assert transport.buffered == 0
+        assert short_flush.done()
+        assert transport.get_write_buffer_limits() == (16384, 65536)
+
+    async def test_flush_waits_for_send_queue(self, bot_instance: XmppBot) -> None:
+        """Test that flush waits for queued stanzas to reach the transport."""
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        queue.put_nowait("<message/>")
+        written: list[str] = []
+        bot_instance._client.transport = _FakeTransport(  # type: ignore[union-attr]
+            bot_instance._client, buffered=0
+        )
+        bot_instance._client.waiting_queue = queue  # type: ignore[union-attr]
+
+        async def run_filters() -> None:
+            await asyncio.sleep(0.01)
+            written.append(await queue.get())
+            queue.task_done()
+
+        task = asyncio.create_task(run_filters())
+        await asyncio.wait_for(bot_instance.flush(timeout=5.0), 1.0)
+
+        assert written == ["<message/>"]
+        await task
+
+    async def test_flush_polls_transport_without_buffer_limits(self, bot_instance: XmppBot) -> None:
+        """Test the polling fallback for transports without write buffer limits."""
+        sizes = iter([64, 32, 0])
+        transport = MagicMock(spec=["get_write_buffer_size"])
+        transport.get_write_buffer_size.side_effect = lambda: next(sizes)
+        bot_instance._client.transport = transport  # type: ignore[union-attr]
+
+        await asyncio.wait_for(bot_instance.flush(timeout=5.0), 1.0)
+
+        assert transport.get_write_buffer_size.call_count == 3
+
+    async def test_flush_fallback_yields_before_polling(self, bot_instance: XmppBot) -> None:
+        """Test that the polling fallback first yields without a timer delay."""
+        sizes = iter([64, 0])
+        transport = MagicMock(spec=["get_write_buffer_size"])
+        transport.get_write_buffer_size.side_effect = lambda: next(sizes)
+        bot_instance._client.transport = transport  # type: ignore[union-attr]
+
+        with patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await bot_instance.flush(timeout=5.0)
+
+        mock_sleep.assert_awaited_once_with(0.0)
+
+
 class TestHandlers:
     """Test handler management."""
 
@@ -121,6 +332,153 @@ class TestHandlers:
         assert "test" not in bot_instance._async_presence_handlers
 
 
+def _make_message(sender: str, body: str) -> dict[str, Any]:
+    """Build a dict-backed stand-in for an incoming chat stanza."""
+    jid = MagicMock()
+    jid.bare = sender.split("/")[0]
+    jid.__str__.return_value = sender
+    return {"type": "chat", "body": body, "from": jid}
+
+
+class TestDispatch:
+    """Test dispatching incoming stanzas to async handlers."""
+
+    async def test_message_handlers_run_concurrently(self, bot_instance: XmppBot) -> None:
+        """Test that async message handlers overlap instead of running serially."""
+        both_started = asyncio.Event()
+        started = 0
+
+        async def handler(sender: str, body: str, msg: Any) -> None:
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1.0)
+
+        bot_instance.add_message_handler("first", handler)
+        bot_instance.add_message_handler("second", handler)
+
+        await bot_instance._on_message(_make_message("user@example.com/phone", "hi"))
+
+        assert both_started.is_set()
+
+    async def test_failing_handler_does_not_block_others(self, bot_instance: XmppBot) -> None:
+        """Test that one failing async handler does not prevent the others."""
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        working = AsyncMock()
+        bot_instance.add_message_handler("failing", failing)
+        bot_instance.add_message_handler("working", working)
+        msg = _make_message("user@example.com/phone", "hi")
+
+        await bot_instance._on_message(msg)
+
+        working.assert_awaited_once_with("user@example.com/phone", "hi", msg)
+
+    async def test_handler_failing_when_called_does_not_block_others(
+        self, bot_instance: XmppBot
+    ) -> None:
+        """Test that a handler raising at call time is skipped, not fatal."""
+
+        async def wrong_arity(sender: str, body: str) -> None:
+            pass
+
+        working = AsyncMock()
+        bot_instance.add_message_handler("wrong", wrong_arity)  # type: ignore[arg-type]
+        bot_instance.add_message_handler("working", working)
+        msg = _make_message("user@example.com/phone", "hi")
+
+        await bot_instance._on_message(msg)
+
+        working.assert_awaited_once_with("user@example.com/phone", "hi", msg)
+
+    async def test_sync_handler_does_not_block_async_ones(self, bot_instance: XmppBot) -> None:
+        """Test that a plain def registered as async handler is logged and skipped."""
+        received: list[str] = []
+
+        def sync_handler(sender: str, body: str, msg: Any) -> None:
+            received.append(body)
+
+        working = AsyncMock()
+        bot_instance.add_message_handler("sync", sync_handler)  # type: ignore[arg-type]
+        bot_instance.add_message_handler("working", working)
+        msg = _make_message("user@example.com/phone", "hi")
+
+        await bot_instance._on_message(msg)
+
+        assert received == ["hi"]
+        working.assert_awaited_once_with("user@example.com/phone", "hi", msg)
+
+    async def test_handler_may_register_another_handler(self, bot_instance: XmppBot) -> None:
+        """Test that registering a handler during dispatch is safe."""
+        late = AsyncMock()
+
+        async def registering(sender: str, body: str, msg: Any) -> None:
+            bot_instance.add_message_handler("late", late)
+
+        bot_instance.add_message_handler("registering", registering)
+
+        await bot_instance._on_message(_make_message("user@example.com", "hi"))
+        late.assert_not_awaited()
+
+        await bot_instance._on_message(_make_message("user@example.com", "again"))
+        late.assert_awaited_once()
+
+    async def test_unauthorized_sender_rejected(
+        self, bot_instance: XmppBot, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that chat messages from senders outside the allowlist are dropped."""
+        handler = AsyncMock()
+        bot_instance.add_message_handler("handler", handler)
+
+        with caplog.at_level(logging.WARNING, logger="xmpp_bot.bot"):
+            await bot_instance._on_message(_make_message("stranger@example.com", "hi"))
+
+        handler.assert_not_awaited()
+        assert "stranger@example.com" in caplog.text
+
+    async def test_unauthorized_non_chat_stanza_dropped_quietly(
+        self, bot_instance: XmppBot, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that non-chat stanzas from strangers are dropped without a warning."""
+        msg = MagicMock()
+        stanza = {**_make_message("stranger@example.com", ""), "type": "headline"}
+        msg.__getitem__.side_effect = lambda key: stanza[key]
+
+        with caplog.at_level(logging.WARNING, logger="xmpp_bot.bot"):
+            await bot_instance._on_message(msg)
+
+        assert not caplog.records
+        assert [call.args[0] for call in msg.__getitem__.call_args_list] == ["from", "type"]
+
+    async def test_presence_handlers_all_called(self, bot_instance: XmppBot) -> None:
+        """Test that every async presence handler receives the update."""
+        first = AsyncMock(side_effect=RuntimeError("boom"))
+        second = AsyncMock()
+        bot_instance.add_presence_handler("first", first)
+        bot_instance.add_presence_handler("second", second)
+        presence = {"from": MagicMock(), "type": "available", "status": "online"}
+
+        await bot_instance._on_presence(presence)
+
+        first.assert_awaited_once()
+        second.assert_awaited_once()
+
+    async def test_sync_presence_handler_does_not_block_async_ones(
+        self, bot_instance: XmppBot
+    ) -> None:
+        """Test that a plain def registered as async presence handler is skipped."""
+        sync_handler = MagicMock(return_value=None)
+        working = AsyncMock()
+        bot_instance.add_presence_handler("sync", sync_handler)
+        bot_instance.add_presence_handler("working", working)
+        presence = {"from": MagicMock(), "type": "available", "status": "online"}
+
+        await bot_instance._on_presence(presence)
+
+        sync_handler.assert_called_once()
+        working.assert_awaited_once()
+
+
 class TestDisconnect:
     """Test bot disconnect."""
 
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from typing import Any
 
 import pytest
 
-from xmpp_bot import HandlerRegistry
+from xmpp_bot import HandlerRegistry, MessageHandler, PresenceHandler
 from xmpp_bot.exceptions import HandlerExistsError, HandlerNotFoundError
 
 
+def _message_handler(sender: str, message: str, stanza: Any) -> None:
+    """No-op message handler; the registry only stores references."""
+
+
+def _other_message_handler(sender: str, message: str, stanza: Any) -> None:
+    """Second no-op message handler, distinct from _message_handler."""
+
+
+def _presence_handler(
+    sender: str, presence_type: str | None, status: str | None, stanza: Any
+) -> None:
+    """No-op presence handler; the registry only stores references."""
+
+
 class TestHandlerRegistry:
     """Test HandlerRegistry class."""
 
@@ -19,21 +33,21 @@ class TestHandlerRegistry:
         return HandlerRegistry()
 
     @pytest.fixture
-    def message_handler(self) -> MagicMock:
-        """Create a mock message handler."""
-        return MagicMock()
+    def message_handler(self) -> MessageHandler:
+        """Provide a message handler."""
+        return _message_handler
 
     @pytest.fixture
-    def presence_handler(self) -> MagicMock:
-        """Create a mock presence handler."""
-        return MagicMock()
+    def presence_handler(self) -> PresenceHandler:
+        """Provide a presence handler."""
+        return _presence_handler
 
 
 class TestMessageHandlers(TestHandlerRegistry):
     """Test message handler management."""
 
     def test_add_message_handler(
-        self, registry: HandlerRegistry, message_handler: MagicMock
+        self, registry: HandlerRegistry, message_handler: MessageHandler
     ) -> None:
         """Test adding a message handler."""
         registry.add_message_handler("test", message_handler)
@@ -41,15 +55,24 @@ class TestMessageHandlers(TestHandlerRegistry):
         assert message_handler in registry.get_message_handlers()
 
     def test_add_duplicate_message_handler(
-        self, registry: HandlerRegistry, message_handler: MagicMock
+        self, registry: HandlerRegistry, message_handler: MessageHandler
     ) -> None:
         """Test that adding duplicate handler raises error."""
         registry.add_message_handler("test", message_handler)
         with pytest.raises(HandlerExistsError):
             registry.add_message_handler("test", message_handler)
 
+    def test_add_duplicate_keeps_original_handler(
+        self, registry: HandlerRegistry, message_handler: MessageHandler
+    ) -> None:
+        """Test that a rejected duplicate does not replace the original handler."""
+        registry.add_message_handler("test", message_handler)
+        with pytest.raises(HandlerExistsError):
+            registry.add_message_handler("test", _other_message_handler)
+        assert tuple(registry.get_message_handlers()) == (message_handler,)
+
     def test_remove_message_handler(
-        self, registry: HandlerRegistry, message_handler: MagicMock
+        self, registry: HandlerRegistry, message_handler: MessageHandler
     ) -> None:
         """Test removing a message handler."""
         registry.add_message_handler("test", message_handler)
@@ -62,10 +85,10 @@ class TestMessageHandlers(TestHandlerRegistry):
             registry.remove_message_handler("nonexistent")
 
     def test_get_message_handlers(
-        self, registry: HandlerRegistry, message_handler: MagicMock
+        self, registry: HandlerRegistry, message_handler: MessageHandler
     ) -> None:
         """Test getting all message handlers."""
-        handler2 = MagicMock()
+        handler2 = _other_message_handler
         registry.add_message_handler("first", message_handler)
         registry.add_message_handler("second", handler2)
 
@@ -74,12 +97,24 @@ class TestMessageHandlers(TestHandlerRegistry):
         assert message_handler in handlers
         assert handler2 in handlers
 
+    def test_get_message_handlers_snapshot_cached(
+        self, registry: HandlerRegistry, message_handler: MessageHandler
+    ) -> None:
+        """Test that the handler snapshot is reused until the registry changes."""
+        registry.add_message_handler("first", message_handler)
+        snapshot = registry.get_message_handlers()
+        assert registry.get_message_handlers() is snapshot
+
+        registry.remove_message_handler("first")
+        assert registry.get_message_handlers() is not snapshot
+        assert len(registry.get_message_handlers()) == 0
+
 
 class TestPresenceHandlers(TestHandlerRegistry):
     """Test presence handler management."""
 
     def test_add_presence_handler(
-        self, registry: HandlerRegistry, presence_handler: MagicMock
+        self, registry: HandlerRegistry, presence_handler: PresenceHandler
     ) -> None:
         """Test adding a presence handler."""
         registry.add_presence_handler("test", presence_handler)
@@ -87,7 +122,7 @@ class TestPresenceHandlers(TestHandlerRegistry):
         assert presence_handler in registry.get_presence_handlers()
 
     def test_add_duplicate_presence_handler(
-        self, registry: HandlerRegistry, presence_handler: MagicMock
+        self, registry: HandlerRegistry, presence_handler: PresenceHandler
     ) -> None:
         """Test that adding duplicate handler raises error."""
         registry.add_presence_handler("test", presence_handler)
@@ -95,7 +130,7 @@ class TestPresenceHandlers(TestHandlerRegistry):
             registry.add_presence_handler("test", presence_handler)
 
     def test_remove_presence_handler(
-        self, registry: HandlerRegistry, presence_handler: MagicMock
+        self, registry: HandlerRegistry, presence_handler: PresenceHandler
     ) -> None:
         """Test removing a presence handler."""
         registry.add_presence_handler("test", presence_handler)
@@ -114,8 +149,8 @@ class TestClearHandlers(TestHandlerRegistry):
     def test_clear(
         self,
         registry: HandlerRegistry,
-        message_handler: MagicMock,
-        presence_handler: MagicMock,
+        message_handler: MessageHandler,
+        presence_handler: PresenceHandler,
     ) -> None:
         """Test clearing all handlers."""
         registry.add_message_handler("msg", message_handler)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import replace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,9 +19,7 @@ class TestAutoReconnect:
         self, bot_instance: XmppBot, mock_slixmpp_modules: dict[str, Any]
     ) -> None:
         """Test that an unexpected disconnect schedules auto-reconnect."""
-        with patch.object(
-            bot_instance, "_auto_reconnect", new_callable=AsyncMock
-        ) as mock_reconnect:
+        with patch.object(XmppBot, "_auto_reconnect", new_callable=AsyncMock) as mock_reconnect:
             bot_instance._on_disconnected({})
             # Flag must be set synchronously before the coroutine runs
             assert bot_instance._reconnecting is True
@@ -34,9 +34,7 @@ class TestAutoReconnect:
         self, bot_instance: XmppBot, mock_slixmpp_modules: dict[str, Any]
     ) -> None:
         """Test that intentional disconnect does not trigger reconnect."""
-        with patch.object(
-            bot_instance, "_auto_reconnect", new_callable=AsyncMock
-        ) as mock_reconnect:
+        with patch.object(XmppBot, "_auto_reconnect", new_callable=AsyncMock) as mock_reconnect:
             bot_instance._disconnect_requested = True
             bot_instance._on_disconnected({})
 
@@ -59,10 +57,16 @@ class TestAutoReconnect:
         assert bot._disconnect_requested is True
 
 
-def _make_mock_client() -> MagicMock:
-    """Create a mock ClientXMPP with standard attributes."""
+def _make_mock_client(on_connect: Callable[[], None] | None = None) -> MagicMock:
+    """Create a mock ClientXMPP with standard attributes.
+
+    ``on_connect`` runs when ``connect()`` is called, standing in for the
+    session_start / failed_auth events slixmpp would fire.
+    """
     mock_client = MagicMock()
     mock_client.connect.return_value = None
+    if on_connect is not None:
+        mock_client.connect.side_effect = lambda *args, **kwargs: on_connect()
     mock_client.add_event_handler = MagicMock()
     mock_client.del_event_handler = MagicMock()
     mock_client.register_plugin = MagicMock()
@@ -70,6 +74,28 @@ def _make_mock_client() -> MagicMock:
     return mock_client
 
 
+def _start_session(bot: XmppBot) -> None:
+    """Simulate a successful session start."""
+    bot._session_started = True
+    bot._ready_event.set()
+
+
+def _timeout_first_wait() -> Callable[..., Awaitable[Any]]:
+    """Build an ``asyncio.wait_for`` stand-in whose first call times out."""
+    real_wait_for = asyncio.wait_for
+    calls = 0
+
+    async def wait_for(aw: Coroutine[Any, Any, Any], timeout: float | None) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            aw.close()
+            raise TimeoutError
+        return await real_wait_for(aw, timeout)
+
+    return wait_for
+
+
 class TestExponentialBackoff:
     """Test exponential backoff for reconnection delays."""
 
@@ -84,13 +110,9 @@ class TestExponentialBackoff:
             patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            async def simulate_auth_failure(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._auth_error = "fail"
-
-            mock_sleep.side_effect = simulate_auth_failure
+            mock_client_class.return_value = _make_mock_client(
+                lambda: bot_instance._on_failed_auth({})
+            )
 
             await bot_instance._auto_reconnect()
 
@@ -105,16 +127,12 @@ class TestExponentialBackoff:
         bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            async def simulate_auth_failure(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._auth_error = "fail"
-
-            mock_sleep.side_effect = simulate_auth_failure
+            mock_client_class.return_value = _make_mock_client(
+                lambda: bot_instance._on_failed_auth({})
+            )
 
             await bot_instance._auto_reconnect()
 
@@ -130,13 +148,9 @@ class TestExponentialBackoff:
             patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            async def simulate_auth_failure(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._auth_error = "fail"
-
-            mock_sleep.side_effect = simulate_auth_failure
+            mock_client_class.return_value = _make_mock_client(
+                lambda: bot_instance._on_failed_auth({})
+            )
 
             await bot_instance._auto_reconnect()
 
@@ -155,16 +169,10 @@ class TestReconnectSuccess:
         bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            async def simulate_session_start(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._session_started = True
-
-            mock_sleep.side_effect = simulate_session_start
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot_instance))
 
             await bot_instance._auto_reconnect()
 
@@ -178,16 +186,12 @@ class TestReconnectSuccess:
         bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            async def simulate_auth_failure(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._auth_error = "Authentication failed"
-
-            mock_sleep.side_effect = simulate_auth_failure
+            mock_client_class.return_value = _make_mock_client(
+                lambda: bot_instance._on_failed_auth({})
+            )
 
             await bot_instance._auto_reconnect()
 
@@ -205,34 +209,13 @@ class TestReconnectRetryAfterTimeout:
         bot_instance._connected = False
         bot_instance._reconnecting = True
 
-        call_count = 0
-
+        # First iteration: times out. Second iteration: succeeds.
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
+            patch("xmpp_bot.bot.asyncio.wait_for", new=_timeout_first_wait()),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            # First iteration: times out. Second iteration: succeeds.
-            time_values = iter(
-                [
-                    0,
-                    valid_settings.connect_timeout + 1,  # 1st attempt: timeout
-                    0,
-                    1,  # 2nd attempt: start_time, then check (within timeout)
-                ]
-            )
-            mock_loop.return_value.time.side_effect = lambda: next(time_values)
-
-            async def simulate_session_on_second(delay: float) -> None:
-                nonlocal call_count
-                if delay == 0.1:
-                    call_count += 1
-                    if call_count >= 2:
-                        bot_instance._session_started = True
-
-            mock_sleep.side_effect = simulate_session_on_second
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot_instance))
 
             await bot_instance._auto_reconnect()
 
@@ -249,24 +232,15 @@ class TestReconnectRetryAfterTimeout:
         bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
         ):
-            second_client = _make_mock_client()
+            second_client = _make_mock_client(lambda: _start_session(bot_instance))
             mock_client_class.side_effect = [
                 RuntimeError("connection refused"),
                 second_client,
             ]
 
-            mock_loop.return_value.time.return_value = 0
-
-            async def simulate_session(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._session_started = True
-
-            mock_sleep.side_effect = simulate_session
-
             await bot_instance._auto_reconnect()
 
             assert mock_client_class.call_count == 2
@@ -282,16 +256,12 @@ class TestReconnectRetryAfterTimeout:
         bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            async def simulate_auth_failure(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._auth_error = "Authentication failed"
-
-            mock_sleep.side_effect = simulate_auth_failure
+            mock_client_class.return_value = _make_mock_client(
+                lambda: bot_instance._on_failed_auth({})
+            )
 
             await bot_instance._auto_reconnect()
 
@@ -309,9 +279,7 @@ class TestReconnectGuard:
         """Test that _on_disconnected does not spawn reconnect when already reconnecting."""
         bot_instance._reconnecting = True
 
-        with patch.object(
-            bot_instance, "_auto_reconnect", new_callable=AsyncMock
-        ) as mock_reconnect:
+        with patch.object(XmppBot, "_auto_reconnect", new_callable=AsyncMock) as mock_reconnect:
             bot_instance._on_disconnected({})
             await asyncio.sleep(0)
 
@@ -326,18 +294,10 @@ class TestReconnectGuard:
         bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
         ):
-            mock_client_class.return_value = _make_mock_client()
-            mock_loop.return_value.time.return_value = 0
-
-            async def simulate_session(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._session_started = True
-
-            mock_sleep.side_effect = simulate_session
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot_instance))
 
             await bot_instance._auto_reconnect()
 
@@ -352,16 +312,12 @@ class TestReconnectGuard:
         bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            async def simulate_auth_failure(delay: float) -> None:
-                if delay == 0.1:
-                    bot_instance._auth_error = "fail"
-
-            mock_sleep.side_effect = simulate_auth_failure
+            mock_client_class.return_value = _make_mock_client(
+                lambda: bot_instance._on_failed_auth({})
+            )
 
             await bot_instance._auto_reconnect()
 
@@ -375,9 +331,7 @@ class TestReconnectTaskTracking:
         self, bot_instance: XmppBot, mock_slixmpp_modules: dict[str, Any]
     ) -> None:
         """Test that 40 rapid disconnect events only spawn one reconnect."""
-        with patch.object(
-            bot_instance, "_auto_reconnect", new_callable=AsyncMock
-        ) as mock_reconnect:
+        with patch.object(XmppBot, "_auto_reconnect", new_callable=AsyncMock) as mock_reconnect:
             # Simulate 40 disconnect events fired synchronously
             for _ in range(40):
                 bot_instance._on_disconnected({})
@@ -443,7 +397,7 @@ class TestReconnectTaskTracking:
         self, bot_instance: XmppBot, mock_slixmpp_modules: dict[str, Any]
     ) -> None:
         """Test that _reconnecting is True immediately after _on_disconnected, before yielding."""
-        with patch.object(bot_instance, "_auto_reconnect", new_callable=AsyncMock):
+        with patch.object(XmppBot, "_auto_reconnect", new_callable=AsyncMock):
             bot_instance._on_disconnected({})
             # Check BEFORE yielding - flag must already be True
             assert bot_instance._reconnecting is True
@@ -469,18 +423,10 @@ class TestReinitializeAfterDisconnect:
 
         # Re-initialize should reset the flag
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
         ):
-            mock_client_class.return_value = _make_mock_client()
-            mock_loop.return_value.time.return_value = 0
-
-            async def set_session(delay: float) -> None:
-                if delay == 0.1:
-                    bot._session_started = True
-
-            mock_sleep.side_effect = set_session
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot))
 
             await bot.initialize(settings=valid_settings)
 
@@ -500,23 +446,15 @@ class TestReinitializeAfterDisconnect:
         bot.disconnect()
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
         ):
-            mock_client_class.return_value = _make_mock_client()
-            mock_loop.return_value.time.return_value = 0
-
-            async def set_session(delay: float) -> None:
-                if delay == 0.1:
-                    bot._session_started = True
-
-            mock_sleep.side_effect = set_session
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot))
 
             await bot.initialize(settings=valid_settings)
 
         # Now simulate an unexpected disconnect
-        with patch.object(bot, "_auto_reconnect", new_callable=AsyncMock) as mock_reconnect:
+        with patch.object(XmppBot, "_auto_reconnect", new_callable=AsyncMock) as mock_reconnect:
             bot._on_disconnected({})
             await asyncio.sleep(0)
 
@@ -537,18 +475,10 @@ class TestReinitializeAfterDisconnect:
         bot.disconnect()
 
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
         ):
-            mock_client_class.return_value = _make_mock_client()
-            mock_loop.return_value.time.return_value = 0
-
-            async def set_session(delay: float) -> None:
-                if delay == 0.1:
-                    bot._session_started = True
-
-            mock_sleep.side_effect = set_session
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot))
 
             await bot.initialize(settings=valid_settings)
 
@@ -566,35 +496,14 @@ class TestTimeoutCleanup:
         bot_instance._connected = False
         bot_instance._reconnecting = True
 
-        call_count = 0
-
+        # First iteration: times out. Second iteration: succeeds.
         with (
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
+            patch("xmpp_bot.bot.asyncio.wait_for", new=_timeout_first_wait()),
             patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
-            patch.object(bot_instance, "_cleanup_client") as mock_cleanup,
+            patch.object(XmppBot, "_cleanup_client") as mock_cleanup,
         ):
-            mock_client_class.return_value = _make_mock_client()
-
-            # First iteration: times out. Second iteration: succeeds.
-            time_values = iter(
-                [
-                    0,
-                    valid_settings.connect_timeout + 1,  # 1st attempt: timeout
-                    0,
-                    1,  # 2nd attempt: within timeout
-                ]
-            )
-            mock_loop.return_value.time.side_effect = lambda: next(time_values)
-
-            async def simulate_session_on_second(delay: float) -> None:
-                nonlocal call_count
-                if delay == 0.1:
-                    call_count += 1
-                    if call_count >= 2:
-                        bot_instance._session_started = True
-
-            mock_sleep.side_effect = simulate_session_on_second
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot_instance))
 
             await bot_instance._auto_reconnect()
 
@@ -610,28 +519,16 @@ class TestKeepAliveConfig:
     """Test XEP-0199 ping and whitespace keepalive configuration."""
 
     async def test_connect_registers_xep_0199(self, valid_settings: Settings) -> None:
-        """Test that _connect registers the xep_0199 plugin."""
+        """Test that _build_client registers the xep_0199 plugin."""
         bot = XmppBot.get_instance()
         bot._settings = valid_settings
 
         mock_xep = MagicMock()
-        mock_client = _make_mock_client()
+        mock_client = _make_mock_client(lambda: _start_session(bot))
         mock_client.__getitem__ = MagicMock(return_value=mock_xep)
 
-        with (
-            patch("xmpp_bot.bot.ClientXMPP", return_value=mock_client),
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
-        ):
-            mock_loop.return_value.time.return_value = 0
-
-            async def set_session(delay: float) -> None:
-                if delay == 0.1:
-                    bot._session_started = True
-
-            mock_sleep.side_effect = set_session
-
-            await bot._connect()
+        with patch("xmpp_bot.bot.ClientXMPP", return_value=mock_client):
+            bot._build_client()
 
         mock_client.register_plugin.assert_any_call("xep_0199")
         mock_xep.enable_keepalive.assert_called_once_with(
@@ -640,25 +537,103 @@ class TestKeepAliveConfig:
         )
 
     async def test_connect_sets_whitespace_keepalive(self, valid_settings: Settings) -> None:
-        """Test that _connect configures whitespace keepalive interval."""
+        """Test that _build_client configures whitespace keepalive interval."""
         bot = XmppBot.get_instance()
         bot._settings = valid_settings
 
-        mock_client = _make_mock_client()
+        mock_client = _make_mock_client(lambda: _start_session(bot))
+
+        with patch("xmpp_bot.bot.ClientXMPP", return_value=mock_client):
+            bot._build_client()
+
+        assert mock_client.whitespace_keepalive_interval == valid_settings.keepalive_interval
+
+
+class TestConnectAddress:
+    """Test connecting to an explicitly configured server address."""
+
+    async def test_connect_uses_configured_host(self, valid_settings: Settings) -> None:
+        """Test that _connect passes host and port when a host is configured."""
+        bot = XmppBot.get_instance()
+        bot._settings = replace(valid_settings, host="xmpp.example.com", port=5223)
+        mock_client = _make_mock_client(lambda: _start_session(bot))
+
+        with patch("xmpp_bot.bot.ClientXMPP", return_value=mock_client):
+            bot._build_client()
+            await bot._connect()
+
+        mock_client.connect.assert_called_once_with("xmpp.example.com", 5223)
+
+    async def test_connect_without_host_uses_dns(self, valid_settings: Settings) -> None:
+        """Test that _connect lets slixmpp resolve the server when no host is set."""
+        bot = XmppBot.get_instance()
+        bot._settings = valid_settings
+        mock_client = _make_mock_client(lambda: _start_session(bot))
+
+        with patch("xmpp_bot.bot.ClientXMPP", return_value=mock_client):
+            bot._build_client()
+            await bot._connect()
+
+        mock_client.connect.assert_called_once_with()
+
+
+class TestClientReuse:
+    """Test reusing the ClientXMPP instance across reconnects."""
+
+    async def test_reconnect_builds_new_client_by_default(self, bot_instance: XmppBot) -> None:
+        """Test that reconnecting replaces the client unless reuse is enabled."""
+        old_client = bot_instance._client
+        bot_instance._reconnecting = True
 
         with (
-            patch("xmpp_bot.bot.ClientXMPP", return_value=mock_client),
-            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
-            patch("xmpp_bot.bot.asyncio.get_event_loop") as mock_loop,
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
+            patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
         ):
-            mock_loop.return_value.time.return_value = 0
+            mock_client_class.return_value = _make_mock_client(lambda: _start_session(bot_instance))
 
-            async def set_session(delay: float) -> None:
-                if delay == 0.1:
-                    bot._session_started = True
+            await bot_instance._auto_reconnect()
 
-            mock_sleep.side_effect = set_session
+        assert mock_client_class.call_count == 1
+        assert bot_instance._client is not old_client
 
-            await bot._connect()
+    async def test_reconnect_reuses_client_when_enabled(
+        self, bot_instance: XmppBot, valid_settings: Settings
+    ) -> None:
+        """Test that reuse_client reconnects the existing client without rebuilding it."""
+        client = _make_mock_client(lambda: _start_session(bot_instance))
+        bot_instance._client = client
+        bot_instance._settings = replace(valid_settings, reuse_client=True)
+        bot_instance._reconnecting = True
 
-        assert mock_client.whitespace_keepalive_interval == valid_settings.keepalive_interval
+        with (
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
+            patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
+        ):
+            await bot_instance._auto_reconnect()
+
+        mock_client_class.assert_not_called()
+        client.del_event_handler.assert_not_called()
+        client.connect.assert_called_once_with()
+        assert bot_instance._client is client
+        assert bot_instance._connected is True
+
+    async def test_reused_client_timeout_aborts_attempt(
+        self, bot_instance: XmppBot, valid_settings: Settings
+    ) -> None:
+        """Test that a timed-out attempt on a reused client is aborted, not discarded."""
+        client = _make_mock_client(lambda: _start_session(bot_instance))
+        bot_instance._client = client
+        bot_instance._settings = replace(valid_settings, reuse_client=True)
+        bot_instance._reconnecting = True
+
+        with (
+            patch("xmpp_bot.bot.asyncio.sleep", new_callable=AsyncMock),
+            patch("xmpp_bot.bot.asyncio.wait_for", new=_timeout_first_wait()),
+            patch("xmpp_bot.bot.ClientXMPP") as mock_client_class,
+        ):
+            await bot_instance._auto_reconnect()
+
+        mock_client_class.assert_not_called()
+        client.abort.assert_called_once()
+        assert client.connect.call_count == 2
+        assert bot_instance._connected is True
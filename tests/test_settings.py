@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
@@ -15,6 +16,24 @@ from xmpp_bot.config.constants import (
     DEFAULT_SEND_DELAY,
 )
 
+_EXPECTED_ALLOWED = frozenset(("one@ex.com", "two@ex.com"))
+
+_ENV_BYTES = b"""
+XMPP_JID=envbot@example.com
+XMPP_PASSWORD=envsecret
+XMPP_DEFAULT_RECEIVER=envuser@example.com
+XMPP_BASE_URL=https://env.example.com
+XMPP_ALLOWED_JIDS=one@ex.com,two@ex.com
+XMPP_CONNECT_TIMEOUT=45
+XMPP_KEEPALIVE_INTERVAL=90
+XMPP_RETRY_DELAY=10.0
+XMPP_SEND_DELAY=0.5
+XMPP_RESOURCE=env-resource
+XMPP_DEBUG=true
+XMPP_HOST=xmpp.example.com
+XMPP_PORT=5223
+"""
+
 
 class TestSettingsValidation:
     """Test Settings validation."""
@@ -64,6 +83,29 @@ class TestSettingsValidation:
         with pytest.raises(ValueError, match="Invalid JID format"):
             Settings(jid="invalid-jid", password="secret", default_receiver="user@example.com")
 
+    @pytest.mark.parametrize(
+        "jid",
+        [
+            "@example.com",
+            "bot@",
+            "bot@example@com",
+            "bot@/res",
+            "bot@example.com/",
+            "bot@ex.com/a@b",
+        ],
+    )
+    def test_malformed_jids_rejected(self, jid: str) -> None:
+        """Test that each malformed JID shape is rejected."""
+        with pytest.raises(ValueError, match="Invalid JID format"):
+            Settings(jid=jid, password="secret", default_receiver="user@example.com")
+
+    def test_resource_may_contain_slash(self) -> None:
+        """Test that everything after the first slash is treated as the resource."""
+        settings = Settings(
+            jid="bot@example.com/a/b", password="secret", default_receiver="user@example.com"
+        )
+        assert settings.jid_domain == "example.com"
+
     def test_invalid_receiver_format(self) -> None:
         """Test that invalid receiver format raises ValueError."""
         with pytest.raises(ValueError, match="Invalid JID format"):
@@ -101,12 +143,36 @@ class TestSettingsProperties:
         )
         assert settings.full_jid == "bot@example.com/existing"
 
+    def test_base_url_stripped(self) -> None:
+        """Test base URL with trailing slashes removed."""
+        settings = Settings(
+            jid="bot@example.com",
+            password="secret",
+            default_receiver="user@example.com",
+            base_url="https://example.com//",
+        )
+        assert settings.base_url_stripped == "https://example.com"
+
+    def test_asdict_round_trip(self, valid_settings: Settings) -> None:
+        """Test that derived values stay out of asdict() and the constructor."""
+        assert valid_settings.full_jid == "bot@example.com/test-bot"
+        assert Settings(**asdict(valid_settings)) == valid_settings
+
     def test_is_jid_allowed_with_allowlist(self, valid_settings: Settings) -> None:
         """Test JID allowlist checking."""
         assert valid_settings.is_jid_allowed("user@example.com") is True
         assert valid_settings.is_jid_allowed("admin@example.com") is True
         assert valid_settings.is_jid_allowed("stranger@example.com") is False
 
+    def test_is_bare_jid_allowed(self, valid_settings: Settings) -> None:
+        """Test allowlist checking for JIDs already stripped of their resource."""
+        assert valid_settings.is_bare_jid_allowed("user@example.com") is True
+        assert valid_settings.is_bare_jid_allowed("stranger@example.com") is False
+
+    def test_is_bare_jid_allowed_no_allowlist(self, minimal_settings: Settings) -> None:
+        """Test that all bare JIDs are allowed when no allowlist is set."""
+        assert minimal_settings.is_bare_jid_allowed("anyone@anywhere.com") is True
+
     def test_is_jid_allowed_with_resource(self, valid_settings: Settings) -> None:
         """Test JID allowlist with resource suffix."""
         assert valid_settings.is_jid_allowed("user@example.com/resource") is True
@@ -123,21 +189,7 @@ class TestSettingsFromEnv:
     def test_from_env_file(self, tmp_path: Path) -> None:
         """Test loading settings from .env file."""
         env_file = tmp_path / ".env"
-        env_file.write_text(
-            """
-XMPP_JID=envbot@example.com
-XMPP_PASSWORD=envsecret
-XMPP_DEFAULT_RECEIVER=envuser@example.com
-XMPP_BASE_URL=https://env.example.com
-XMPP_ALLOWED_JIDS=one@ex.com,two@ex.com
-XMPP_CONNECT_TIMEOUT=45
-XMPP_KEEPALIVE_INTERVAL=90
-XMPP_RETRY_DELAY=10.0
-XMPP_SEND_DELAY=0.5
-XMPP_RESOURCE=env-resource
-XMPP_DEBUG=true
-"""
-        )
+        env_file.write_bytes(_ENV_BYTES)
 
         settings = Settings.from_env(env_file)
 
@@ -145,13 +197,15 @@ XMPP_DEBUG=true
         assert settings.password == "envsecret"
         assert settings.default_receiver == "envuser@example.com"
         assert settings.base_url == "https://env.example.com"
-        assert settings.allowed_jids == frozenset(["one@ex.com", "two@ex.com"])
+        assert settings.allowed_jids == _EXPECTED_ALLOWED
         assert settings.connect_timeout == 45
         assert settings.keepalive_interval == 90
         assert settings.retry_delay == 10.0
         assert settings.send_delay == 0.5
         assert settings.resource == "env-resource"
         assert settings.debug is True
+        assert settings.host == "xmpp.example.com"
+        assert settings.port == 5223
 
 
 class TestSettingsFromDict:
@@ -174,7 +228,7 @@ class TestSettingsFromDict:
         assert settings.password == "dictsecret"
         assert settings.default_receiver == "dictuser@example.com"
         assert settings.base_url == "https://dict.example.com"
-        assert settings.allowed_jids == frozenset(["one@ex.com", "two@ex.com"])
+        assert settings.allowed_jids == _EXPECTED_ALLOWED
         assert settings.debug is True
 
     def test_from_dict_with_string_allowed_jids(self) -> None:
@@ -187,7 +241,38 @@ class TestSettingsFromDict:
         }
 
         settings = Settings.from_dict(data)
-        assert settings.allowed_jids == frozenset(["one@ex.com", "two@ex.com"])
+        assert settings.allowed_jids == _EXPECTED_ALLOWED
+
+    def test_from_dict_with_host_and_port(self) -> None:
+        """Test creating settings with an explicit server address."""
+        data = {
+            "jid": "bot@example.com",
+            "password": "secret",
+            "default_receiver": "user@example.com",
+            "host": "xmpp.example.com",
+            "port": "5223",
+        }
+
+        settings = Settings.from_dict(data)
+        assert settings.host == "xmpp.example.com"
+        assert settings.port == 5223
+
+    def test_from_dict_with_reuse_client(self) -> None:
+        """Test enabling client reuse across reconnects."""
+        data = {
+            "jid": "bot@example.com",
+            "password": "secret",
+            "default_receiver": "user@example.com",
+            "reuse_client": True,
+        }
+
+        settings = Settings.from_dict(data)
+        assert settings.reuse_client is True
+
+    def test_host_defaults_to_dns_lookup(self, minimal_settings: Settings) -> None:
+        """Test that no host is set by default so slixmpp resolves the server."""
+        assert minimal_settings.host is None
+        assert minimal_settings.port == 5222
 
     def test_frozen_settings(self, valid_settings: Settings) -> None:
         """Test that settings are immutable."""
@@ -1,6 +1,7 @@
 """Send a test message via XMPP Bot."""
 
 import asyncio
+from collections.abc import Callable
 
 from xmpp_bot import XmppBot
 from xmpp_bot.exceptions import AuthenticationError, ConnectionError, XmppBotError
@@ -11,14 +12,24 @@ async def main() -> None:
     bot = XmppBot.get_instance()
     await bot.initialize()
     await bot.send_message("Test message from XMPP Bot")
-    await asyncio.sleep(1)
+    await bot.flush()
     bot.disconnect()
     print("Test message sent successfully!")
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Use uvloop when it is installed, otherwise the default event loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+            runner.run(main())
     except AuthenticationError as e:
         print(f"Authentication failed: {e}")
         print("Please check your JID and password in .env file.")